@@ -13,20 +13,85 @@ Requirements:
     - Android device connected via ADB
     - Rust daemon running on local machine
     - Both devices on same WiFi network
+    - orjson (optional, speeds up writing --output results)
+
+Profiling note:
+    This script is I/O-bound: nearly all wall time is spent awaiting ADB
+    round-trips, the daemon's TCP bind and logcat output. Optimization work
+    should target concurrency (asyncio), subprocess reuse (the persistent
+    adb shell) and log-stream multiplexing (LogcatMonitor). CPU-level
+    rewrites (C extensions, Numba/Cython, SIMD, process pools) do not apply.
 """
 
-import subprocess
+import asyncio
+import atexit
 import json
+import os
 import time
-import socket
-import threading
 import argparse
 import sys
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import shlex
+import struct
+from collections import Counter, deque
+from typing import Deque, Dict, FrozenSet, List, Optional, Pattern, Tuple
+from dataclasses import asdict, dataclass
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Number of recent logcat lines kept for patterns registered after the fact
+MAX_BUFFER_SIZE = 10000
+
+# Binary logcat entry header: payload length, header size, pid, tid, sec, nsec.
+# Headers from v2 on append lid/uid fields, which are skipped via header size.
+LOGGER_ENTRY_HEADER = struct.Struct("<HHiiii")
+
+# Android log priorities, indexed by the priority byte of each entry
+LOG_PRIORITIES = "??VDIWEFS"
+LOG_MIN_PRIORITY = LOG_PRIORITIES.index("D")
+
+# Tags relevant to the integration tests
+LOG_TAGS: FrozenSet[str] = frozenset({
+    "LibreConnectService",
+    "DeviceDiscovery",
+    "NetworkManager",
+    "ProtocolAdapter",
+})
+
+# Marker echoed after each persistent adb shell command, followed by its exit code
+ADB_SHELL_SENTINEL = "__DONE__"
+
+# Buffered console output is flushed once it reaches this many characters
+LOG_FLUSH_SIZE = 8192
+
+# ANSI colors per log level, only used when stdout is a terminal
+LOG_COLORS = {
+    "INFO": "\033[36m",    # Cyan
+    "PASS": "\033[32m",    # Green
+    "FAIL": "\033[31m",    # Red
+    "WARN": "\033[33m",    # Yellow
+    "RESET": "\033[0m"     # Reset
+}
+
+# Log patterns confirming each test phase
+DISCOVERY_RE = re.compile(r"Discovered device.*DESKTOP.*1716", re.IGNORECASE)
+CONNECT_RE = re.compile(r"Successfully connected to.*|Device connected:", re.IGNORECASE)
+
+# Plugin test cases as (name, plugin type, pre-serialized JSON message)
+_PLUGIN_CASES: Tuple[Tuple[str, str, str], ...] = (
+    ("Clipboard Sync", "clipboard", '{"content": "test message"}'),
+    ("Input Share", "input", '{"action": "press", "keyCode": "A"}'),
+    ("Touchpad Mode", "touchpad", '{"x": 100, "y": 100, "dx": 5, "dy": 5}'),
+    ("Media Control", "media", '{"action": "play"}'),
+    ("Remote Commands", "remote", '{"command": "echo", "args": ["hello"]}'),
+    ("Slide Control", "slide", '{"action": "next"}'),
+    ("Battery Status", "battery", '{"charge": 85, "isCharging": true}'),
+)
+
 class TestResult(Enum):
     PASS = "✅ PASS"
     FAIL = "❌ FAIL"
@@ -41,44 +106,199 @@ class TestCase:
     details: str = ""
     duration: float = 0.0
 
+def _json_default(obj):
+    """Serialize TestCase and TestResult for the stdlib json fallback"""
+    if isinstance(obj, TestResult):
+        return obj.value
+    if isinstance(obj, TestCase):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class LogcatMonitor:
+    """Single long-lived binary logcat stream shared by every log pattern waiter"""
+
+    def __init__(self, process: asyncio.subprocess.Process, max_lines: int = MAX_BUFFER_SIZE):
+        self.process = process
+        self.recent_lines: Deque[str] = deque(maxlen=max_lines)
+        self._waiters: List[Tuple[Pattern, asyncio.Future]] = []
+        self._reader_task = asyncio.create_task(self._dispatch())
+
+    async def _read_entry(self) -> Optional[str]:
+        """Read one binary log entry, formatted only if its tag and priority match"""
+        stdout = self.process.stdout
+        header = await stdout.readexactly(LOGGER_ENTRY_HEADER.size)
+        length, hdr_size, pid, tid, sec, nsec = LOGGER_ENTRY_HEADER.unpack(header)
+        if hdr_size > LOGGER_ENTRY_HEADER.size:
+            await stdout.readexactly(hdr_size - LOGGER_ENTRY_HEADER.size)
+        payload = await stdout.readexactly(length)
+
+        priority = payload[0] if payload else 0
+        tag, _, message = payload[1:].partition(b"\0")
+        tag = tag.decode(errors="replace")
+        if tag not in LOG_TAGS or priority < LOG_MIN_PRIORITY:
+            return None
+
+        message = message.rstrip(b"\0").decode(errors="replace")
+
+        level = LOG_PRIORITIES[priority] if priority < len(LOG_PRIORITIES) else "?"
+        timestamp = time.strftime("%m-%d %H:%M:%S", time.localtime(sec))
+        return f"{timestamp}.{nsec // 1000000:03d} {pid:5d} {tid:5d} {level} {tag}: {message}"
+
+    async def _dispatch(self):
+        """Read the logcat stream once and fan each entry out to the waiters"""
+        while True:
+            try:
+                line = await self._read_entry()
+            except asyncio.IncompleteReadError:
+                break
+            if line is None:
+                continue
+            self.recent_lines.append(line)
+            for pattern, future in self._waiters:
+                if not future.done() and pattern.search(line):
+                    future.set_result(True)
+
+    async def wait_for(self, pattern: Pattern, timeout: float) -> bool:
+        """Wait until a buffered or future log line matches pattern"""
+        if any(pattern.search(line) for line in self.recent_lines):
+            return True
+
+        waiter = (pattern, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        try:
+            return await asyncio.wait_for(waiter[1], timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters.remove(waiter)
+
+    async def stop(self):
+        """Terminate the logcat process and its reader task"""
+        if self.process.returncode is None:
+            self.process.terminate()
+            await self.process.wait()
+        self._reader_task.cancel()
+        try:
+            await self._reader_task
+        except asyncio.CancelledError:
+            pass
+
 class LibreConnectTester:
     def __init__(self):
         self.daemon_process = None
+        self.logcat: Optional[LogcatMonitor] = None
+        self._adb_shell: Optional[asyncio.subprocess.Process] = None
+        self._adb_shell_lock = asyncio.Lock()
         self.daemon_port = 1716
         self.daemon_host = "localhost"
         self.android_package = "dev.libretools.connect"
         self.test_results: List[TestCase] = []
+        self._log_buf: List[str] = []
+        self._log_buf_size = 0
+        atexit.register(self._flush_log)
+        # Skip ANSI colors when output is piped or NO_COLOR is set
+        self._use_color = sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
 
     def log(self, message: str, level: str = "INFO"):
         """Enhanced logging with timestamps and colors"""
         timestamp = time.strftime("%H:%M:%S")
-        colors = {
-            "INFO": "\033[36m",    # Cyan
-            "PASS": "\033[32m",    # Green
-            "FAIL": "\033[31m",    # Red
-            "WARN": "\033[33m",    # Yellow
-            "RESET": "\033[0m"     # Reset
-        }
-        color = colors.get(level, colors["INFO"])
-        print(f"{color}[{timestamp}] {level}: {message}{colors['RESET']}")
-
-    def run_command(self, cmd: List[str], timeout: int = 30) -> Tuple[bool, str]:
+        if self._use_color:
+            color = LOG_COLORS.get(level, LOG_COLORS["INFO"])
+            line = f"{color}[{timestamp}] {level}: {message}{LOG_COLORS['RESET']}\n"
+        else:
+            line = f"[{timestamp}] {level}: {message}\n"
+        self._log_buf.append(line)
+        self._log_buf_size += len(line)
+        if self._log_buf_size >= LOG_FLUSH_SIZE:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Write buffered log lines to stdout in a single call"""
+        if self._log_buf:
+            sys.stdout.write("".join(self._log_buf))
+            sys.stdout.flush()
+            self._log_buf.clear()
+            self._log_buf_size = 0
+
+    async def _sleep(self, delay: float):
+        """Flush buffered log output, then sleep"""
+        self._flush_log()
+        await asyncio.sleep(delay)
+
+    async def run_command(self, cmd: List[str], timeout: int = 30) -> Tuple[bool, str]:
         """Run shell command with timeout and error handling"""
+        self._flush_log()
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            return result.returncode == 0, result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            return False, f"Command timed out after {timeout}s"
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return False, f"Command timed out after {timeout}s"
+            output = stdout.decode(errors="replace") + stderr.decode(errors="replace")
+            return proc.returncode == 0, output
         except Exception as e:
             return False, f"Command failed: {str(e)}"
 
-    def check_prerequisites(self) -> bool:
+    async def open_adb_shell(self):
+        """Open a persistent adb shell session reused by adb_sh"""
+        self._adb_shell = await asyncio.create_subprocess_exec(
+            "adb", "shell",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+
+    async def close_adb_shell(self):
+        """Close the persistent adb shell session"""
+        shell, self._adb_shell = self._adb_shell, None
+        if shell and shell.returncode is None:
+            shell.kill()
+            await shell.wait()
+
+    async def adb_sh(self, cmd: List[str], timeout: int = 30) -> Tuple[bool, str]:
+        """Run command on the device through the persistent adb shell session"""
+        self._flush_log()
+        async with self._adb_shell_lock:
+            try:
+                if self._adb_shell is None:
+                    await self.open_adb_shell()
+
+                # Start the sentinel on a fresh line in case output lacks a trailing newline
+                line = f"{shlex.join(cmd)} 2>&1; printf '\\n%s%d\\n' {ADB_SHELL_SENTINEL} $?\n"
+                self._adb_shell.stdin.write(line.encode())
+                await self._adb_shell.stdin.drain()
+                return await asyncio.wait_for(self._read_adb_sh_output(), timeout)
+            except asyncio.TimeoutError:
+                # The session may still emit output for this command, so drop it
+                await self.close_adb_shell()
+                return False, f"Command timed out after {timeout}s"
+            except Exception as e:
+                await self.close_adb_shell()
+                return False, f"Command failed: {str(e)}"
+
+    async def _read_adb_sh_output(self) -> Tuple[bool, str]:
+        """Collect adb shell output up to the sentinel line"""
+        output = []
+        async for raw in self._adb_shell.stdout:
+            line = raw.decode(errors="replace")
+            if line.startswith(ADB_SHELL_SENTINEL):
+                # Drop the newline printed ahead of the sentinel
+                text = "".join(output)
+                if text.endswith("\n"):
+                    text = text[:-1]
+                return line[len(ADB_SHELL_SENTINEL):].strip() == "0", text
+            output.append(line)
+
+        await self.close_adb_shell()
+        return False, "".join(output) or "adb shell session closed"
+
+    async def check_prerequisites(self) -> bool:
         """Verify all testing prerequisites are met"""
         self.log("🔍 Checking Prerequisites...", "INFO")
 
@@ -88,82 +308,94 @@ class LibreConnectTester:
             ("Network Interface", ["ip", "addr", "show"]),
         ]
 
+        results = await asyncio.gather(*(self.run_command(cmd) for _, cmd in tests))
+
         all_passed = True
-        for test_name, cmd in tests:
-            success, output = self.run_command(cmd)
+        for (test_name, _), (success, output) in zip(tests, results):
             if success:
                 self.log(f"{test_name}: {TestResult.PASS.value}", "PASS")
             else:
                 self.log(f"{test_name}: {TestResult.FAIL.value} - {output}", "FAIL")
                 all_passed = False
 
+        if all_passed:
+            # A larger log ring buffer keeps matching lines from being evicted
+            success, output = await self.run_command(["adb", "logcat", "-G", "2M"])
+            if not success:
+                self.log(f"Could not resize logcat buffer: {output}", "WARN")
+
         return all_passed
 
-    def start_daemon(self) -> bool:
+    async def start_daemon(self) -> bool:
         """Start LibreConnect daemon in background"""
         self.log("🚀 Starting LibreConnect Daemon...", "INFO")
 
         try:
             # Check if daemon is already running
-            if self.is_daemon_running():
+            if await self.is_daemon_running():
                 self.log("Daemon already running", "WARN")
                 return True
 
             # Start daemon process
-            self.daemon_process = subprocess.Popen(
-                ["cargo", "run", "--release", "--bin", "libreconnectd"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+            self.daemon_process = await asyncio.create_subprocess_exec(
+                "cargo", "run", "--release", "--bin", "libreconnectd",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
                 cwd="."
             )
 
-            # Wait for daemon to start
-            for i in range(10):
-                time.sleep(1)
-                if self.is_daemon_running():
+            # Wait for daemon to start, polling with exponential backoff
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 15
+            delay = 0.05
+            while loop.time() < deadline:
+                if await self.is_daemon_running(timeout=0.05):
                     self.log("Daemon started successfully", "PASS")
                     return True
+                await self._sleep(delay)
+                delay = min(delay * 1.5, 0.5)
 
-            self.log("Daemon failed to start within 10 seconds", "FAIL")
+            self.log("Daemon failed to start within 15 seconds", "FAIL")
             return False
 
         except Exception as e:
             self.log(f"Failed to start daemon: {str(e)}", "FAIL")
             return False
 
-    def is_daemon_running(self) -> bool:
+    async def is_daemon_running(self, timeout: float = 1) -> bool:
         """Check if daemon is listening on expected port"""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(1)
-            result = sock.connect_ex((self.daemon_host, self.daemon_port))
-            sock.close()
-            return result == 0
-        except:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.daemon_host, self.daemon_port),
+                timeout
+            )
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except (OSError, asyncio.TimeoutError):
             return False
 
-    def stop_daemon(self):
+    async def stop_daemon(self):
         """Stop the daemon process"""
         if self.daemon_process:
-            self.daemon_process.terminate()
-            self.daemon_process.wait(timeout=5)
+            if self.daemon_process.returncode is None:
+                self.daemon_process.terminate()
+            await asyncio.wait_for(self.daemon_process.wait(), timeout=5)
             self.log("Daemon stopped", "INFO")
 
-    def install_android_app(self) -> bool:
+    async def install_android_app(self) -> bool:
         """Install Android APK and verify installation"""
         self.log("📱 Installing Android App...", "INFO")
 
         apk_path = "mobile/android/app/build/outputs/apk/debug/app-debug.apk"
 
         # Check if APK exists
-        success, _ = self.run_command(["test", "-f", apk_path])
-        if not success:
+        if not os.path.isfile(apk_path):
             self.log(f"APK not found at {apk_path}", "FAIL")
             return False
 
         # Install APK
-        success, output = self.run_command(["adb", "install", "-r", apk_path])
+        success, output = await self.run_command(["adb", "install", "-r", apk_path])
         if success:
             self.log("APK installed successfully", "PASS")
             return True
@@ -171,46 +403,57 @@ class LibreConnectTester:
             self.log(f"APK installation failed: {output}", "FAIL")
             return False
 
-    def start_android_logging(self) -> subprocess.Popen:
+    async def start_android_logging(self) -> Optional[LogcatMonitor]:
         """Start Android log monitoring in background"""
         self.log("📋 Starting Android log monitoring...", "INFO")
 
-        log_cmd = [
-            "adb", "logcat", "-s",
-            "LibreConnectService:D",
-            "DeviceDiscovery:D",
-            "NetworkManager:D",
-            "ProtocolAdapter:D"
-        ]
-
-        return subprocess.Popen(log_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        success, output = await self.adb_sh(["pidof", "-s", self.android_package])
+        app_pid = output.strip()
+        if not success or not app_pid.isdigit():
+            self.log(f"Could not find app process for log monitoring: {output}", "WARN")
+            return None
+
+        # Binary output (-B) ignores tag filter specs, but logd still applies
+        # --pid on the device, so only the app's own entries cross ADB. The app
+        # process is fresh after install and launch, so replaying its entries
+        # picks up startup lines without stale ones. Tags are filtered by
+        # LogcatMonitor; exec-out keeps the binary stream free of tty mangling.
+        log_cmd = ["adb", "exec-out", "logcat", "-B", f"--pid={app_pid}"]
+
+        log_process = await asyncio.create_subprocess_exec(
+            *log_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        self.logcat = LogcatMonitor(log_process)
+        return self.logcat
 
-    def launch_android_app(self) -> bool:
+    async def launch_android_app(self) -> bool:
         """Launch LibreConnect Android app"""
         self.log("🚀 Launching Android App...", "INFO")
 
         # Launch main activity
-        success, output = self.run_command([
-            "adb", "shell", "am", "start",
+        success, output = await self.adb_sh([
+            "am", "start",
             "-n", f"{self.android_package}/.MainActivity"
         ])
 
         if success:
             self.log("Android app launched", "PASS")
-            time.sleep(3)  # Wait for app to initialize
+            await self._sleep(3)  # Wait for app to initialize
             return True
         else:
             self.log(f"Failed to launch app: {output}", "FAIL")
             return False
 
-    def test_device_discovery(self) -> TestCase:
+    async def test_device_discovery(self) -> TestCase:
         """Test mDNS device discovery functionality"""
         test = TestCase(
             name="Device Discovery",
             description="Test mDNS discovery of desktop device from Android"
         )
 
-        start_time = time.time()
+        start_time = time.monotonic()
         self.log("🔍 Testing Device Discovery...", "INFO")
 
         try:
@@ -218,8 +461,8 @@ class LibreConnectTester:
             self.log("Starting device discovery scan...", "INFO")
 
             # Send discovery intent
-            success, output = self.run_command([
-                "adb", "shell", "am", "broadcast",
+            success, output = await self.adb_sh([
+                "am", "broadcast",
                 "-a", "dev.libretools.connect.DISCOVER_DEVICES",
                 "-n", f"{self.android_package}/.service.LibreConnectService"
             ])
@@ -231,11 +474,11 @@ class LibreConnectTester:
 
             # Wait for discovery results
             self.log("Waiting for discovery results...", "INFO")
-            time.sleep(5)
+            await self._sleep(5)
 
             # Check Android logs for discovery success
-            log_success = self.check_android_logs_for_pattern(
-                "Discovered device.*DESKTOP.*1716",
+            log_success = await self.check_android_logs_for_pattern(
+                DISCOVERY_RE,
                 timeout=10
             )
 
@@ -252,23 +495,23 @@ class LibreConnectTester:
             test.result = TestResult.FAIL
             test.details = f"Discovery test exception: {str(e)}"
 
-        test.duration = time.time() - start_time
+        test.duration = time.monotonic() - start_time
         return test
 
-    def test_connection_establishment(self) -> TestCase:
+    async def test_connection_establishment(self) -> TestCase:
         """Test TCP connection between Android and daemon"""
         test = TestCase(
             name="Connection Establishment",
             description="Test TCP connection establishment and handshake"
         )
 
-        start_time = time.time()
+        start_time = time.monotonic()
         self.log("🔗 Testing Connection Establishment...", "INFO")
 
         try:
             # Simulate connection attempt via ADB
-            success, output = self.run_command([
-                "adb", "shell", "am", "broadcast",
+            success, output = await self.adb_sh([
+                "am", "broadcast",
                 "-a", "dev.libretools.connect.CONNECT_DEVICE",
                 "-e", "deviceId", "test-desktop-device",
                 "-n", f"{self.android_package}/.service.LibreConnectService"
@@ -280,11 +523,11 @@ class LibreConnectTester:
                 return test
 
             # Wait for connection attempt
-            time.sleep(3)
+            await self._sleep(3)
 
             # Check for successful connection in logs
-            connection_success = self.check_android_logs_for_pattern(
-                "Successfully connected to.*|Device connected:",
+            connection_success = await self.check_android_logs_for_pattern(
+                CONNECT_RE,
                 timeout=10
             )
 
@@ -301,110 +544,105 @@ class LibreConnectTester:
             test.result = TestResult.FAIL
             test.details = f"Connection test exception: {str(e)}"
 
-        test.duration = time.time() - start_time
+        test.duration = time.monotonic() - start_time
         return test
 
-    def test_plugin_communication(self) -> List[TestCase]:
-        """Test individual plugin message communication"""
-        self.log("🔌 Testing Plugin Communication...", "INFO")
+    @staticmethod
+    def _plugin_test_case(plugin_name: str, error: Optional[BaseException] = None) -> TestCase:
+        """Create the TestCase for a plugin, marked failed if error is given"""
+        test = TestCase(
+            name=f"Plugin: {plugin_name}",
+            description=f"Test {plugin_name} message sending and protocol"
+        )
+        if error is not None:
+            test.result = TestResult.FAIL
+            test.details = f"{plugin_name} test exception: {str(error)}"
+        return test
 
-        plugins = [
-            ("Clipboard Sync", "clipboard", {"content": "test message"}),
-            ("Input Share", "input", {"action": "press", "keyCode": "A"}),
-            ("Touchpad Mode", "touchpad", {"x": 100, "y": 100, "dx": 5, "dy": 5}),
-            ("Media Control", "media", {"action": "play"}),
-            ("Remote Commands", "remote", {"command": "echo", "args": ["hello"]}),
-            ("Slide Control", "slide", {"action": "next"}),
-            ("Battery Status", "battery", {"charge": 85, "isCharging": True}),
-        ]
+    async def _run_plugin(
+        self, plugin_name: str, plugin_type: str, data_json: str, sent_pattern: Pattern
+    ) -> TestCase:
+        """Send a single plugin message and wait for its log confirmation"""
+        test = self._plugin_test_case(plugin_name)
 
-        test_results = []
+        start_time = time.monotonic()
 
-        for plugin_name, plugin_type, test_data in plugins:
-            test = TestCase(
-                name=f"Plugin: {plugin_name}",
-                description=f"Test {plugin_name} message sending and protocol"
-            )
-
-            start_time = time.time()
+        try:
+            # Send plugin message via ADB
+            success, output = await self.adb_sh([
+                "am", "broadcast",
+                "-a", "dev.libretools.connect.SEND_PLUGIN_MESSAGE",
+                "-e", "deviceId", "test-desktop-device",
+                "-e", "pluginType", plugin_type,
+                "-e", "message", data_json,
+                "-n", f"{self.android_package}/.service.LibreConnectService"
+            ])
 
-            try:
-                # Send plugin message via ADB
-                data_json = json.dumps(test_data)
-                success, output = self.run_command([
-                    "adb", "shell", "am", "broadcast",
-                    "-a", "dev.libretools.connect.SEND_PLUGIN_MESSAGE",
-                    "-e", "deviceId", "test-desktop-device",
-                    "-e", "pluginType", plugin_type,
-                    "-e", "message", data_json,
-                    "-n", f"{self.android_package}/.service.LibreConnectService"
-                ])
-
-                if success:
-                    # Check logs for message sent confirmation
-                    message_sent = self.check_android_logs_for_pattern(
-                        f"Sent.*message.*{plugin_type}|Sending.*{plugin_name}",
-                        timeout=5
-                    )
-
-                    if message_sent:
-                        test.result = TestResult.PASS
-                        test.details = f"{plugin_name} message sent successfully"
-                    else:
-                        test.result = TestResult.WARN
-                        test.details = f"{plugin_name} message triggered but confirmation unclear"
+            if success:
+                # Check logs for message sent confirmation
+                message_sent = await self.check_android_logs_for_pattern(
+                    sent_pattern,
+                    timeout=5
+                )
+
+                if message_sent:
+                    test.result = TestResult.PASS
+                    test.details = f"{plugin_name} message sent successfully"
                 else:
-                    test.result = TestResult.FAIL
-                    test.details = f"Failed to send {plugin_name} message: {output}"
-
-            except Exception as e:
+                    test.result = TestResult.WARN
+                    test.details = f"{plugin_name} message triggered but confirmation unclear"
+            else:
                 test.result = TestResult.FAIL
-                test.details = f"{plugin_name} test exception: {str(e)}"
+                test.details = f"Failed to send {plugin_name} message: {output}"
 
-            test.duration = time.time() - start_time
-            test_results.append(test)
+        except Exception as e:
+            test = self._plugin_test_case(plugin_name, e)
 
-        return test_results
+        test.duration = time.monotonic() - start_time
+        return test
 
-    def check_android_logs_for_pattern(self, pattern: str, timeout: int = 10) -> bool:
-        """Check Android logs for specific pattern within timeout"""
-        try:
-            # Get recent logs
-            success, logs = self.run_command([
-                "adb", "logcat", "-d", "-s",
-                "LibreConnectService:D", "DeviceDiscovery:D", "NetworkManager:D"
-            ])
+    async def test_plugin_communication(self) -> List[TestCase]:
+        """Test individual plugin message communication"""
+        self.log("🔌 Testing Plugin Communication...", "INFO")
 
-            if success and re.search(pattern, logs, re.IGNORECASE):
-                return True
+        patterns = [
+            re.compile(rf"Sent.*message.*{plugin_type}|Sending.*{plugin_name}", re.IGNORECASE)
+            for plugin_name, plugin_type, _ in _PLUGIN_CASES
+        ]
 
-            # If not found in recent logs, monitor for new logs
-            log_process = subprocess.Popen([
-                "adb", "logcat", "-s",
-                "LibreConnectService:D", "DeviceDiscovery:D", "NetworkManager:D"
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                line = log_process.stdout.readline()
-                if line and re.search(pattern, line, re.IGNORECASE):
-                    log_process.terminate()
-                    return True
-                time.sleep(0.1)
+        # Plugins are independent, so their broadcasts and log waits overlap
+        results = await asyncio.gather(
+            *[self._run_plugin(*plugin, pattern) for plugin, pattern in zip(_PLUGIN_CASES, patterns)],
+            return_exceptions=True
+        )
+
+        test_results = []
+        for (plugin_name, _, _), result in zip(_PLUGIN_CASES, results):
+            if isinstance(result, BaseException):
+                result = self._plugin_test_case(plugin_name, result)
+            test_results.append(result)
+
+        return test_results
 
-            log_process.terminate()
+    async def check_android_logs_for_pattern(self, pattern: Pattern, timeout: int = 10) -> bool:
+        """Check Android logs for specific pattern within timeout"""
+        if self.logcat is None:
+            self.log("Log monitoring not started", "WARN")
             return False
 
+        self._flush_log()
+        try:
+            return await self.logcat.wait_for(pattern, timeout)
         except Exception as e:
             self.log(f"Log monitoring error: {str(e)}", "WARN")
             return False
 
-    def run_all_tests(self) -> Dict[str, any]:
+    async def run_all_tests(self) -> Dict[str, any]:
         """Run complete test suite"""
         self.log("🧪 Starting LibreConnect Integration Test Suite", "INFO")
         self.log("=" * 60, "INFO")
 
-        start_time = time.time()
+        start_time = time.monotonic()
         results = {
             "start_time": time.strftime("%Y-%m-%d %H:%M:%S"),
             "tests": [],
@@ -414,71 +652,65 @@ class LibreConnectTester:
 
         try:
             # Prerequisites
-            if not self.check_prerequisites():
+            if not await self.check_prerequisites():
                 self.log("Prerequisites check failed. Aborting tests.", "FAIL")
                 return results
 
             # Start daemon
-            if not self.start_daemon():
+            if not await self.start_daemon():
                 self.log("Failed to start daemon. Aborting tests.", "FAIL")
                 return results
 
-            # Install and launch Android app
-            if not self.install_android_app():
+            # Install Android app
+            if not await self.install_android_app():
                 self.log("Failed to install Android app. Aborting tests.", "FAIL")
                 return results
 
-            if not self.launch_android_app():
+            if not await self.launch_android_app():
                 self.log("Failed to launch Android app. Aborting tests.", "FAIL")
                 return results
 
-            # Start log monitoring
-            log_process = self.start_android_logging()
+            # Start log monitoring, filtered on the device to the app process
+            await self.start_android_logging()
 
-            # Run test phases
+            # Run test phases in order: connecting needs a discovered device and
+            # plugin messages are only sent to connected devices
             self.log("\n📋 Phase 1: Device Discovery", "INFO")
-            discovery_test = self.test_device_discovery()
+            discovery_test = await self.test_device_discovery()
             self.test_results.append(discovery_test)
 
             self.log("\n📋 Phase 2: Connection Establishment", "INFO")
-            connection_test = self.test_connection_establishment()
+            connection_test = await self.test_connection_establishment()
             self.test_results.append(connection_test)
 
             self.log("\n📋 Phase 3: Plugin Communication", "INFO")
-            plugin_tests = self.test_plugin_communication()
+            plugin_tests = await self.test_plugin_communication()
             self.test_results.extend(plugin_tests)
 
-            # Stop log monitoring
-            log_process.terminate()
-
         except Exception as e:
             self.log(f"Test suite exception: {str(e)}", "FAIL")
 
         finally:
             # Cleanup
-            self.stop_daemon()
+            if self.logcat:
+                await self.logcat.stop()
+            await self.close_adb_shell()
+            await self.stop_daemon()
+            self._flush_log()
 
         # Generate results summary
-        total_duration = time.time() - start_time
+        total_duration = time.monotonic() - start_time
         results["duration"] = total_duration
-        results["tests"] = [
-            {
-                "name": test.name,
-                "description": test.description,
-                "result": test.result.value,
-                "details": test.details,
-                "duration": test.duration
-            }
-            for test in self.test_results
-        ]
+        results["tests"] = list(self.test_results)
 
         # Calculate summary statistics
+        counts = Counter(t.result for t in self.test_results)
         summary = {
             "total": len(self.test_results),
-            "passed": len([t for t in self.test_results if t.result == TestResult.PASS]),
-            "failed": len([t for t in self.test_results if t.result == TestResult.FAIL]),
-            "warnings": len([t for t in self.test_results if t.result == TestResult.WARN]),
-            "skipped": len([t for t in self.test_results if t.result == TestResult.SKIP]),
+            "passed": counts[TestResult.PASS],
+            "failed": counts[TestResult.FAIL],
+            "warnings": counts[TestResult.WARN],
+            "skipped": counts[TestResult.SKIP],
         }
 
         results["summary"] = summary
@@ -486,6 +718,7 @@ class LibreConnectTester:
 
         # Print final report
         self.print_test_report(results)
+        self._flush_log()
 
         return results
 
@@ -504,11 +737,11 @@ class LibreConnectTester:
         self.log(f"⏱️  Total Duration: {results['duration']:.2f}s", "INFO")
 
         self.log("\n📋 Detailed Results:", "INFO")
-        for test_data in results["tests"]:
-            status_icon = "✅" if "PASS" in test_data["result"] else "❌" if "FAIL" in test_data["result"] else "⚠️"
-            self.log(f"  {status_icon} {test_data['name']}: {test_data['result']}", "INFO")
-            if test_data["details"]:
-                self.log(f"     └─ {test_data['details']}", "INFO")
+        for test in results["tests"]:
+            status_icon = "✅" if test.result == TestResult.PASS else "❌" if test.result == TestResult.FAIL else "⚠️"
+            self.log(f"  {status_icon} {test.name}: {test.result.value}", "INFO")
+            if test.details:
+                self.log(f"     └─ {test.details}", "INFO")
 
         # Overall result
         if results["success"]:
@@ -520,7 +753,7 @@ class LibreConnectTester:
 
         self.log("=" * 60, "INFO")
 
-def main():
+async def main():
     parser = argparse.ArgumentParser(description="LibreConnect Integration Tester")
     parser.add_argument(
         "--mode",
@@ -553,7 +786,7 @@ def main():
 
     # Run tests based on mode
     if args.mode == "all":
-        results = tester.run_all_tests()
+        results = await tester.run_all_tests()
     else:
         tester.log(f"Individual test modes not yet implemented: {args.mode}", "WARN")
         return 1
@@ -561,14 +794,19 @@ def main():
     # Save results if output file specified
     if args.output:
         try:
-            with open(args.output, 'w') as f:
-                json.dump(results, f, indent=2)
+            if orjson:
+                with open(args.output, 'wb') as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(args.output, 'w') as f:
+                    json.dump(results, f, indent=2, default=_json_default)
             tester.log(f"Results saved to {args.output}", "INFO")
         except Exception as e:
             tester.log(f"Failed to save results: {str(e)}", "WARN")
 
     # Return appropriate exit code
+    tester._flush_log()
     return 0 if results["success"] else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))